@@ -6,6 +6,7 @@ Usage:
 """
 
 from portfolio_optimization.algorithms import get_algorithm, list_algorithms
+from portfolio_optimization.utils.covariance import COVARIANCE_ESTIMATORS
 from portfolio_optimization.utils.formatting import print_header
 
 
@@ -15,16 +16,21 @@ def get_user_input(prompt: str, default: str) -> str:
     return user_input if user_input else default
 
 
-def get_int_input(prompt: str, default: int) -> int:
+def get_int_input(prompt: str, default: int, minimum: int | None = None) -> int:
     """Get integer input with validation."""
     while True:
         user_input = input(f"{prompt} [{default}]: ").strip()
         if not user_input:
             return default
         try:
-            return int(user_input)
+            value = int(user_input)
         except ValueError:
             print("  Please enter a valid number.")
+            continue
+        if minimum is not None and value < minimum:
+            print(f"  Please enter a number of at least {minimum}.")
+            continue
+        return value
 
 
 def get_float_input(prompt: str, default: float) -> float:
@@ -39,6 +45,17 @@ def get_float_input(prompt: str, default: float) -> float:
             print("  Please enter a valid number.")
 
 
+def get_choice_input(prompt: str, choices: list[str], default: str) -> str:
+    """Get input restricted to a set of choices."""
+    while True:
+        user_input = input(f"{prompt} ({', '.join(choices)}) [{default}]: ").strip()
+        if not user_input:
+            return default
+        if user_input in choices:
+            return user_input
+        print(f"  Please enter one of: {', '.join(choices)}.")
+
+
 def select_algorithm() -> str:
     """Let user select an algorithm from available options."""
     available = list_algorithms()
@@ -76,20 +93,29 @@ def main() -> None:
 
     # Common parameters
     period = get_user_input("Historical data period (e.g., 5y, 10y)", "10y")
+    covariance_method = get_choice_input(
+        "Covariance estimator", list(COVARIANCE_ESTIMATORS), "sample"
+    )
 
     # Algorithm-specific parameters
-    optimizer = algorithm_class(period=period)
+    optimizer = algorithm_class(period=period, covariance_method=covariance_method)
 
     if algorithm_name == "monte_carlo_resampling":
         portfolios = get_int_input("Number of portfolios on frontier", 10)
         shrinkage = get_float_input("Shrinkage intensity (0.0 - 1.0)", 0.7)
         simulations = get_int_input("Number of simulations", 500)
+        factors = get_int_input(
+            "Number of risk factors (0 = full covariance)", 0, minimum=0
+        )
+        workers = get_int_input("Worker processes", 1, minimum=1)
 
         print("\n")
         optimizer.optimize(
             shrinkage_intensity=shrinkage,
             num_simulations=simulations,
             num_portfolios=portfolios,
+            num_factors=factors or None,
+            n_jobs=workers,
         )
     elif algorithm_name == "minimum_variance":
         # Minimum variance only returns a single portfolio
@@ -5,9 +5,19 @@ from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
+import scipy.linalg as linalg
 
-from config import load_assets
-from data import fetch_ticker_data, calculate_monthly_returns, calculate_yearly_returns
+from portfolio_optimization.config import load_assets
+from portfolio_optimization.data import (
+    fetch_tickers_data,
+    calculate_monthly_returns,
+    calculate_yearly_returns,
+)
+from portfolio_optimization.utils.covariance import (
+    COVARIANCE_ESTIMATORS,
+    covariance_factor,
+    factor_model,
+)
 
 
 @dataclass
@@ -34,42 +44,84 @@ class BaseOptimizer(ABC):
     name: str = "base"
     description: str = "Base optimizer"
 
-    def __init__(self, period: str = "10y"):
+    def __init__(self, period: str = "10y", covariance_method: str = "sample"):
         """
         Initialize the optimizer.
 
         Args:
             period: Historical data period (e.g., "5y", "10y")
+            covariance_method: Covariance estimator ("sample" or "ledoit_wolf")
+
+        Raises:
+            ValueError: If covariance_method is not recognized
         """
+        if covariance_method not in COVARIANCE_ESTIMATORS:
+            available = ", ".join(COVARIANCE_ESTIMATORS.keys())
+            raise ValueError(
+                f"Unknown covariance method '{covariance_method}'. Available: {available}"
+            )
+
         self.period = period
+        self.covariance_method = covariance_method
         self.tickers: list[str] = []
         self.data: list[pd.DataFrame] = []
         self.monthly_returns: list[pd.DataFrame] = []
         self.yearly_returns: list[pd.DataFrame] = []
+        self.yearly_returns_array: np.ndarray | None = None  # (num_assets, num_years)
         self.covariance_matrix: np.ndarray | None = None
+        self._covariance_factor: np.ndarray | None = None  # L with L @ L.T == cov
+        self._covariance_cho: tuple[np.ndarray, bool] | None = None  # None if singular
+        self._factor_models: dict[int, tuple[np.ndarray, np.ndarray]] = {}
         self._data_loaded = False
+        self._loaded_settings: tuple | None = None
 
     def load_data(self) -> None:
         """Load and prepare market data for optimization."""
         self.tickers = load_assets()
-        self.data = [
-            fetch_ticker_data(ticker, period=self.period) for ticker in self.tickers
-        ]
+        self.data = fetch_tickers_data(self.tickers, period=self.period)
         self.monthly_returns = [calculate_monthly_returns(d) for d in self.data]
         self.yearly_returns = [calculate_yearly_returns(d) for d in self.data]
 
-        # Compute covariance matrix
-        yearly_returns_array = np.array(
+        # Stack yearly returns and compute the covariance matrix and its
+        # factor once; optimize() calls reuse them until the data is reloaded
+        self.yearly_returns_array = np.array(
             [df.values.flatten() for df in self.yearly_returns]
         )
-        self.covariance_matrix = np.cov(yearly_returns_array)
+        estimator = COVARIANCE_ESTIMATORS[self.covariance_method]
+        self.covariance_matrix = estimator(self.yearly_returns_array)
+        try:
+            self._covariance_cho = linalg.cho_factor(self.covariance_matrix, lower=True)
+            self._covariance_factor = np.tril(self._covariance_cho[0])
+        except linalg.LinAlgError:
+            # Singular (e.g. fewer years than assets): no Cholesky factor
+            self._covariance_cho = None
+            self._covariance_factor = covariance_factor(self.covariance_matrix)
+        self._factor_models = {}
         self._data_loaded = True
+        self._loaded_settings = (
+            tuple(self.tickers),
+            self.period,
+            self.covariance_method,
+        )
+
+    def _current_settings(self) -> tuple:
+        """Settings the loaded data depends on: tickers, period and estimator."""
+        # load_assets() is cached on the file's mtime, so this stays cheap
+        return (tuple(load_assets()), self.period, self.covariance_method)
 
     def _ensure_data_loaded(self) -> None:
-        """Ensure data is loaded before optimization."""
-        if not self._data_loaded:
+        """Ensure data is loaded and matches the current assets and settings."""
+        if not self._data_loaded or self._loaded_settings != self._current_settings():
             self.load_data()
 
+    def _get_factor_model(self, num_factors: int) -> tuple[np.ndarray, np.ndarray]:
+        """Factor model (F, D) of the covariance matrix, cached per num_factors."""
+        if num_factors not in self._factor_models:
+            self._factor_models[num_factors] = factor_model(
+                self.covariance_matrix, num_factors
+            )
+        return self._factor_models[num_factors]
+
     @abstractmethod
     def optimize(self, **kwargs) -> OptimizationResult:
         """
@@ -87,10 +139,18 @@ class BaseOptimizer(ABC):
         """Calculate portfolio volatility given weights."""
         if self.covariance_matrix is None:
             raise ValueError("Data not loaded. Call load_data() first.")
-        return float(np.sqrt(weights.T @ self.covariance_matrix @ weights))
+        return float(np.sqrt(weights @ (self.covariance_matrix @ weights)))
+
+    def calculate_portfolio_volatilities(self, weights: np.ndarray) -> np.ndarray:
+        """Calculate volatilities for a batch of portfolios (one per row)."""
+        if self.covariance_matrix is None:
+            raise ValueError("Data not loaded. Call load_data() first.")
+        return np.sqrt(
+            np.einsum("ij,jk,ik->i", weights, self.covariance_matrix, weights)
+        )
 
     def calculate_portfolio_return(
         self, weights: np.ndarray, expected_returns: np.ndarray
     ) -> float:
         """Calculate expected portfolio return given weights."""
-        return float(np.sum(weights * expected_returns))
+        return float(weights @ expected_returns)
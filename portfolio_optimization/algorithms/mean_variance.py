@@ -3,7 +3,7 @@
 import numpy as np
 
 from portfolio_optimization.algorithms.base import BaseOptimizer, OptimizationResult
-from portfolio_optimization.utils.solvers import minimize_variance_portfolio
+from portfolio_optimization.utils.solvers import efficient_frontier_portfolios
 from portfolio_optimization.utils.formatting import (
     print_header,
     print_subheader,
@@ -50,9 +50,7 @@ class MeanVariance(BaseOptimizer):
         # =====================================================================
         # EXPECTED RETURNS (simple historical average)
         # =====================================================================
-        expected_returns = np.array([
-            df.values.mean() for df in self.yearly_returns
-        ])
+        expected_returns = self.yearly_returns_array.mean(axis=1)
 
         # =====================================================================
         # TARGET RETURNS (EFFICIENT FRONTIER)
@@ -64,8 +62,6 @@ class MeanVariance(BaseOptimizer):
         # =====================================================================
         # OPTIMIZATION
         # =====================================================================
-        weights = np.zeros((num_portfolios, len(self.tickers)))
-
         if verbose:
             print_header("MEAN-VARIANCE OPTIMIZATION")
             print_key_value("Algorithm", self.description)
@@ -74,22 +70,24 @@ class MeanVariance(BaseOptimizer):
             print_key_value("Frontier Points", num_portfolios)
             print_subheader("Computing Efficient Frontier")
 
-        for i, target_return in enumerate(target_returns):
-            optimal_weights = minimize_variance_portfolio(
-                expected_returns, target_return, self.covariance_matrix
-            )
-            weights[i] = optimal_weights
+        weights = efficient_frontier_portfolios(
+            expected_returns,
+            target_returns,
+            self.covariance_matrix,
+            covariance_cho=self._covariance_cho,
+            closed_form=self._covariance_cho is not None,
+        )
 
-            if verbose:
-                print(f"  Portfolio {i + 1}/{num_portfolios}: target return = {target_return:.2%}")
+        if verbose:
+            print("\n".join(
+                f"  Portfolio {i + 1}/{num_portfolios}: target return = {target_return:.2%}"
+                for i, target_return in enumerate(target_returns)
+            ))
 
         # =====================================================================
         # CALCULATE VOLATILITIES
         # =====================================================================
-        volatilities = np.array([
-            self.calculate_portfolio_volatility(weights[i])
-            for i in range(num_portfolios)
-        ])
+        volatilities = self.calculate_portfolio_volatilities(weights)
 
         result = OptimizationResult(
             weights=weights,
@@ -58,10 +58,8 @@ class MinimumVariance(BaseOptimizer):
         volatility = self.calculate_portfolio_volatility(weights)
 
         # Calculate expected return using historical average
-        expected_returns = np.array([
-            df.values.mean() for df in self.yearly_returns
-        ])
-        portfolio_return = float(np.sum(weights * expected_returns))
+        expected_returns = self.yearly_returns_array.mean(axis=1)
+        portfolio_return = self.calculate_portfolio_return(weights, expected_returns)
 
         result = OptimizationResult(
             weights=weights.reshape(1, -1),  # Shape: (1, num_assets)
@@ -1,9 +1,13 @@
 """Monte Carlo Resampling portfolio optimization algorithm."""
 
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import numpy as np
 
 from portfolio_optimization.algorithms.base import BaseOptimizer, OptimizationResult
-from portfolio_optimization.utils.solvers import minimize_variance_portfolio
+from portfolio_optimization.utils.solvers import efficient_frontier_portfolios_batch
 from portfolio_optimization.utils.formatting import (
     print_header,
     print_subheader,
@@ -11,6 +15,9 @@ from portfolio_optimization.utils.formatting import (
     print_results,
 )
 
+# Simulations solved per batch (and per progress update)
+SIMULATION_BATCH_SIZE = 100
+
 
 class MonteCarloResampling(BaseOptimizer):
     """
@@ -35,6 +42,8 @@ class MonteCarloResampling(BaseOptimizer):
         shrinkage_intensity: float = 0.7,
         num_simulations: int = 500,
         num_portfolios: int = 10,
+        num_factors: int | None = None,
+        n_jobs: int = 1,
         verbose: bool = True,
     ) -> OptimizationResult:
         """
@@ -45,30 +54,43 @@ class MonteCarloResampling(BaseOptimizer):
                 Higher values pull expected returns toward a more conservative estimate.
             num_simulations: Number of Monte Carlo simulations to run
             num_portfolios: Number of portfolios on the efficient frontier
+            num_factors: If set, sample return uncertainty from a k-factor model
+                of the covariance (F F' + D) instead of the full matrix
+            n_jobs: Number of worker processes for the simulations (1 runs
+                everything in the current process). Worker processes may be
+                spawned (the default on macOS and Windows), so scripts that
+                pass n_jobs > 1 must call optimize() under an
+                ``if __name__ == "__main__":`` guard.
             verbose: If True, print progress information
 
         Returns:
             OptimizationResult with averaged weights across simulations
+
+        Raises:
+            ValueError: If n_jobs is smaller than 1, or num_factors is set but
+                smaller than 1
         """
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be at least 1, got {n_jobs}")
+        if num_factors is not None and num_factors < 1:
+            raise ValueError(f"num_factors must be at least 1, got {num_factors}")
+
         self._ensure_data_loaded()
 
         # =====================================================================
         # EXPECTED RETURNS ESTIMATION (SHRINKAGE)
         # =====================================================================
-        mean_sample = np.mean(self.yearly_returns, axis=1)
+        mean_sample = self.yearly_returns_array.mean(axis=1)
         mean_target = np.divide(mean_sample, 2.2)
 
         mean_shrunk = (
             shrinkage_intensity * mean_target + (1 - shrinkage_intensity) * mean_sample
-        ).squeeze()
+        )
 
         # =====================================================================
         # ESTIMATION UNCERTAINTY
         # =====================================================================
-        yearly_returns_array = np.array(
-            [df.values.flatten() for df in self.yearly_returns]
-        )
-        num_periods = yearly_returns_array.shape[1]
+        num_periods = self.yearly_returns_array.shape[1]
         estimation_uncertainty = self.covariance_matrix / num_periods
 
         # =====================================================================
@@ -81,9 +103,9 @@ class MonteCarloResampling(BaseOptimizer):
         # =====================================================================
         # MONTE CARLO SIMULATION
         # =====================================================================
-        weight_storage = np.zeros(
-            (num_simulations, num_portfolios, len(self.tickers))
-        )
+        # Per-simulation weights only feed the average, so keep a running sum
+        # instead of storing every simulation's frontier
+        weight_sum = np.zeros((num_portfolios, len(self.tickers)))
 
         if verbose:
             print_header("MONTE CARLO RESAMPLING OPTIMIZATION")
@@ -92,36 +114,76 @@ class MonteCarloResampling(BaseOptimizer):
             print_key_value("Period", self.period)
             print_key_value("Shrinkage Intensity", f"{shrinkage_intensity:.1%}")
             print_key_value("Simulations", num_simulations)
+            if num_factors is not None:
+                print_key_value("Risk Factors", num_factors)
             print_key_value("Frontier Points", num_portfolios)
             print_subheader("Running Simulations")
 
-        for i in range(num_simulations):
-            # Sample expected returns from uncertainty distribution
-            sampled_returns = np.random.multivariate_normal(
-                mean_shrunk, estimation_uncertainty
+        # Sample expected returns from uncertainty distribution
+        if num_factors is not None:
+            # Factor structure Sigma ~ F F' + D, decomposed once per data load;
+            # each draw then costs O(n * k) instead of O(n^2)
+            loadings, specific_variance = self._get_factor_model(num_factors)
+            factor_normal = np.random.standard_normal(
+                (num_simulations, loadings.shape[1])
             )
+            specific_normal = np.random.standard_normal(
+                (num_simulations, len(self.tickers))
+            )
+            sampled_returns = mean_shrunk + (
+                factor_normal @ loadings.T + specific_normal * np.sqrt(specific_variance)
+            ) / np.sqrt(num_periods)
+        else:
+            # Reuse the cached covariance factor: mean + Z @ L.T, Z ~ N(0, I)
+            uncertainty_factor = self._covariance_factor / np.sqrt(num_periods)
+            standard_normal = np.random.standard_normal(
+                (num_simulations, len(self.tickers))
+            )
+            sampled_returns = mean_shrunk + standard_normal @ uncertainty_factor.T
+
+        # Optimize for each target return level, in batches of simulations.
+        # Batches are independent, so they can be spread over processes.
+        batches = [
+            sampled_returns[start:start + SIMULATION_BATCH_SIZE]
+            for start in range(0, num_simulations, SIMULATION_BATCH_SIZE)
+        ]
+        solve_batch = partial(
+            efficient_frontier_portfolios_batch,
+            target_returns=target_returns,
+            covariance_matrix=self.covariance_matrix,
+            covariance_cho=self._covariance_cho,
+            closed_form=self._covariance_cho is not None,
+        )
+
+        executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+        try:
+            batch_results = (executor.map if executor else map)(solve_batch, batches)
+
+            stop = 0
+            for batch_weights in batch_results:
+                stop += len(batch_weights)
+                weight_sum += batch_weights.sum(axis=0)
 
-            # Optimize for each target return level
-            for k, target_return in enumerate(target_returns):
-                optimal_weights = minimize_variance_portfolio(
-                    sampled_returns, target_return, self.covariance_matrix
-                )
-                weight_storage[i, k, :] = optimal_weights
+                # Progress indicator, updated in place on one line
+                if verbose:
+                    sys.stdout.write(
+                        f"\r  Progress: {stop:>5} / {num_simulations} simulations"
+                    )
+                    sys.stdout.flush()
 
-            # Progress indicator
-            if verbose and ((i + 1) % 100 == 0 or i == num_simulations - 1):
-                print(f"  Progress: {i + 1:>5} / {num_simulations} simulations")
+            if verbose:
+                sys.stdout.write("\n")
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         # =====================================================================
         # AGGREGATE RESULTS
         # =====================================================================
-        average_weights = np.mean(weight_storage, axis=0)
+        average_weights = weight_sum / num_simulations
 
         # Calculate volatilities for each portfolio
-        volatilities = np.array([
-            self.calculate_portfolio_volatility(average_weights[i])
-            for i in range(num_portfolios)
-        ])
+        volatilities = self.calculate_portfolio_volatilities(average_weights)
 
         result = OptimizationResult(
             weights=average_weights,
@@ -1,11 +1,28 @@
 """Asset configuration loader."""
 
-import json
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    from json import loads as _loads
+
+
+ASSETS_PATH = Path(__file__).parent / "assets.json"
+
 
 def load_assets() -> list[str]:
-    """Load the list of asset tickers from the configuration file."""
-    assets_path = Path(__file__).parent / "assets.json"
-    with open(assets_path, "r") as f:
-        return json.load(f)["assets"]
+    """
+    Load the list of asset tickers from the configuration file.
+
+    The parsed file is cached and only re-read when its modification time
+    changes.
+    """
+    return list(_read_assets(str(ASSETS_PATH), ASSETS_PATH.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=16)
+def _read_assets(assets_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Parse an assets file; mtime_ns is part of the cache key only."""
+    return tuple(_loads(Path(assets_path).read_bytes())["assets"])
@@ -1,13 +1,19 @@
 """Data fetching and returns calculation module."""
 
-from portfolio_optimization.data.fetcher import fetch_ticker_data
+from portfolio_optimization.data.fetcher import (
+    clear_memory_cache,
+    fetch_ticker_data,
+    fetch_tickers_data,
+)
 from portfolio_optimization.data.returns import (
     calculate_monthly_returns,
     calculate_yearly_returns,
 )
 
 __all__ = [
+    "clear_memory_cache",
     "fetch_ticker_data",
+    "fetch_tickers_data",
     "calculate_monthly_returns",
     "calculate_yearly_returns",
 ]
@@ -4,12 +4,34 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 import pandas as pd
-import yfinance as yf
 
 
 # Cache directory at project root level
 CACHE_DIR = Path(__file__).resolve().parents[2] / "cache"
 
+# In-process cache so repeated optimizer runs skip the CSV/network round-trip
+_MEMORY_CACHE: dict[tuple[str, str, str, datetime], pd.DataFrame] = {}
+
+
+def _cache_file(ticker: str, period: str, interval: str) -> Path:
+    """Return the CSV cache path for a ticker, creating the period directory."""
+    # Create period subdirectory: cache/10y/, cache/5y/, etc.
+    period_cache_dir = CACHE_DIR / period
+    period_cache_dir.mkdir(parents=True, exist_ok=True)
+    return period_cache_dir / f"{ticker}_{interval}.csv"
+
+
+def _read_cached(cache_file: Path, max_age_days: int) -> pd.DataFrame | None:
+    """Read a cached CSV if it exists and is fresh enough, else return None."""
+    if not cache_file.exists():
+        return None
+    file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
+    if file_age >= timedelta(days=max_age_days):
+        return None
+    df = pd.read_csv(cache_file, header=[0, 1], index_col=0)
+    df.index = pd.to_datetime(df.index)
+    return df
+
 
 def fetch_ticker_data(
     ticker: str,
@@ -21,7 +43,8 @@ def fetch_ticker_data(
     """
     Fetch historical adjusted close prices for a given ticker.
 
-    Uses local cache to avoid repeated API calls. Cache is organized by period:
+    Uses local cache to avoid repeated API calls. Frames already loaded in this
+    process are returned from memory. The on-disk cache is organized by period:
         cache/
           10y/
             NVDA_1d.csv
@@ -39,29 +62,87 @@ def fetch_ticker_data(
     Returns:
         DataFrame with historical price data
     """
-    # Create period subdirectory: cache/10y/, cache/5y/, etc.
-    period_cache_dir = CACHE_DIR / period
-    period_cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = period_cache_dir / f"{ticker}_{interval}.csv"
-
-    # Check if cached data exists and is fresh enough
-    if cache_file.exists():
-        file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if file_age < timedelta(days=max_age_days):
-            df = pd.read_csv(cache_file, header=[0, 1], index_col=0)
-            df.index = pd.to_datetime(df.index)
-            return df
-
-    # Fetch fresh data from yfinance
-    data = yf.download(
-        ticker,
+    return fetch_tickers_data(
+        [ticker],
         period=period,
         interval=interval,
-        auto_adjust=True,
-        progress=False,
+        max_age_days=max_age_days,
         end=end,
-    )
+    )[0]
+
+
+def fetch_tickers_data(
+    tickers: list[str],
+    period: str = "5y",
+    interval: str = "1d",
+    max_age_days: int = 1,
+    end: datetime = datetime(2025, 12, 31),
+) -> list[pd.DataFrame]:
+    """
+    Fetch historical adjusted close prices for several tickers.
+
+    Tickers found in the memory or disk cache are served from there; all
+    remaining tickers are fetched with a single batched yfinance request and
+    then cached individually, in the same layout as fetch_ticker_data.
+
+    Args:
+        tickers: Stock ticker symbols
+        period: Data period (e.g., "5y", "1y")
+        interval: Data interval (e.g., "1d", "1wk")
+        max_age_days: Maximum age of cached data before refreshing
+        end: End date for data fetching
+
+    Returns:
+        List of DataFrames with historical price data, in the order of tickers
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    missing: list[str] = []
+
+    for ticker in tickers:
+        key = (ticker, period, interval, end)
+        if key in _MEMORY_CACHE:
+            frames[ticker] = _MEMORY_CACHE[key]
+            continue
+
+        df = _read_cached(_cache_file(ticker, period, interval), max_age_days)
+        if df is None:
+            missing.append(ticker)
+        else:
+            _MEMORY_CACHE[key] = df
+            frames[ticker] = df
+
+    if missing:
+        # Deferred: importing yfinance is slow and unneeded on cache hits
+        import yfinance as yf
+
+        # Fetch fresh data from yfinance in one request
+        data = yf.download(
+            missing,
+            period=period,
+            interval=interval,
+            auto_adjust=True,
+            progress=False,
+            end=end,
+        )
+
+        for ticker in missing:
+            # Keep the (Price, Ticker) column levels of a single-ticker download
+            df = data.loc[:, data.columns.get_level_values(1) == ticker]
+
+            # Drop dates before this ticker's history starts; skip the copy
+            # when there are none
+            all_nan = df.isna().all(axis=1).to_numpy()
+            if all_nan.any():
+                df = df.loc[~all_nan]
+
+            # Save to cache
+            df.to_csv(_cache_file(ticker, period, interval))
+            _MEMORY_CACHE[(ticker, period, interval, end)] = df
+            frames[ticker] = df
+
+    return [frames[ticker] for ticker in tickers]
+
 
-    # Save to cache
-    data.to_csv(cache_file)
-    return data
+def clear_memory_cache() -> None:
+    """Drop in-process cached frames so the next fetch re-reads disk or network."""
+    _MEMORY_CACHE.clear()
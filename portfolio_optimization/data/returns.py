@@ -3,6 +3,39 @@
 import pandas as pd
 
 
+def _period_returns(data: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """
+    Calculate period-over-period returns from the last close in each period.
+
+    A calendar period without any prices (e.g. a trading halt) keeps the
+    previous period's close, so it shows up as a 0% return rather than
+    being merged into the next period's return.
+
+    Args:
+        data: DataFrame with 'Close' column containing daily prices
+        freq: Period frequency ("M" for months, "Y" for years)
+
+    Returns:
+        DataFrame of percentage returns indexed by period end date
+    """
+    prices = data["Close"]
+    period_close = prices.groupby(prices.index.to_period(freq)).last()
+    period_close = period_close.reindex(
+        pd.period_range(
+            period_close.index[0],
+            period_close.index[-1],
+            freq=freq,
+            name=period_close.index.name,
+        )
+    ).ffill()
+
+    closes = period_close.to_numpy()
+    returns = closes[1:] / closes[:-1] - 1.0
+
+    index = period_close.index[1:].to_timestamp(how="end").normalize()
+    return pd.DataFrame(returns, index=index, columns=period_close.columns)
+
+
 def calculate_monthly_returns(data: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate monthly returns from daily price data.
@@ -13,8 +46,7 @@ def calculate_monthly_returns(data: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with monthly percentage returns
     """
-    monthly_prices = data["Close"].resample("ME").ffill()
-    return monthly_prices.pct_change().dropna()
+    return _period_returns(data, "M")
 
 
 def calculate_yearly_returns(data: pd.DataFrame) -> pd.DataFrame:
@@ -27,5 +59,4 @@ def calculate_yearly_returns(data: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with yearly percentage returns
     """
-    yearly_prices = data["Close"].resample("YE").ffill()
-    return yearly_prices.pct_change().dropna()
+    return _period_returns(data, "Y")
@@ -1,6 +1,12 @@
 """Shared utilities for portfolio optimization."""
 
 from portfolio_optimization.utils.solvers import minimize_variance_portfolio
+from portfolio_optimization.utils.covariance import (
+    covariance_factor,
+    factor_model,
+    ledoit_wolf_covariance,
+    sample_covariance,
+)
 from portfolio_optimization.utils.formatting import (
     print_header,
     print_subheader,
@@ -11,6 +17,10 @@ from portfolio_optimization.utils.formatting import (
 
 __all__ = [
     "minimize_variance_portfolio",
+    "covariance_factor",
+    "factor_model",
+    "ledoit_wolf_covariance",
+    "sample_covariance",
     "print_header",
     "print_subheader",
     "print_key_value",
@@ -0,0 +1,117 @@
+"""Covariance matrix estimators."""
+
+import numpy as np
+
+
+def sample_covariance(returns: np.ndarray) -> np.ndarray:
+    """
+    Unbiased sample covariance matrix.
+
+    Args:
+        returns: Asset returns, shape (num_assets, num_periods)
+
+    Returns:
+        Covariance matrix, shape (num_assets, num_assets)
+    """
+    num_periods = returns.shape[1]
+    centered = returns - returns.mean(axis=1, keepdims=True)
+
+    # One GEMM on the centered data, scaled in place
+    covariance = centered @ centered.T
+    covariance /= num_periods - 1
+    return covariance
+
+
+def ledoit_wolf_covariance(returns: np.ndarray) -> np.ndarray:
+    """
+    Ledoit-Wolf shrinkage covariance matrix.
+
+    Shrinks the sample covariance toward a scaled identity with the
+    intensity from Ledoit & Wolf (2004). The result is well-conditioned
+    even when there are fewer periods than assets, which is the usual case
+    for yearly returns.
+
+    Args:
+        returns: Asset returns, shape (num_assets, num_periods)
+
+    Returns:
+        Covariance matrix, shape (num_assets, num_assets)
+    """
+    num_assets, num_periods = returns.shape
+    centered = returns.T - returns.mean(axis=1)
+
+    # Maximum-likelihood sample covariance and the shrinkage target scale
+    sample = centered.T @ centered / num_periods
+    target_scale = np.trace(sample) / num_assets
+
+    # Distance of the sample to the target, and sampling noise of the sample
+    distance = np.sum((sample - target_scale * np.eye(num_assets)) ** 2)
+    squared_norms = np.sum(centered**2, axis=1)
+    noise = (np.sum(squared_norms**2) - num_periods * np.sum(sample**2)) / num_periods**2
+
+    shrinkage = min(noise, distance) / distance if distance > 0 else 0.0
+
+    covariance = (1 - shrinkage) * sample
+    covariance.flat[:: num_assets + 1] += shrinkage * target_scale
+    return covariance
+
+
+def covariance_factor(covariance: np.ndarray) -> np.ndarray:
+    """
+    Matrix square root L with L @ L.T == covariance, for sampling.
+
+    Uses the Cholesky factor when the matrix is positive definite and falls
+    back to an eigendecomposition for singular (positive semi-definite)
+    matrices, such as a sample covariance with fewer periods than assets.
+
+    Args:
+        covariance: Covariance matrix, shape (num_assets, num_assets)
+
+    Returns:
+        Factor L, shape (num_assets, num_assets)
+    """
+    try:
+        return np.linalg.cholesky(covariance)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+
+def factor_model(
+    covariance: np.ndarray,
+    num_factors: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Approximate a covariance matrix as F @ F.T + diag(D).
+
+    The loadings F are the leading eigenvectors of the covariance matrix,
+    scaled by the square roots of their eigenvalues; D is whatever variance
+    of the diagonal the factors do not explain.
+
+    Args:
+        covariance: Covariance matrix, shape (num_assets, num_assets)
+        num_factors: Number of factors k to keep (capped at the number of assets)
+
+    Returns:
+        Tuple of loadings F, shape (num_assets, k), and specific variances D,
+        shape (num_assets,)
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+
+    # eigh sorts ascending, so the leading factors are the last columns
+    num_factors = min(num_factors, len(eigenvalues))
+    leading = slice(len(eigenvalues) - num_factors, None)
+    loadings = eigenvectors[:, leading] * np.sqrt(
+        np.clip(eigenvalues[leading], 0, None)
+    )
+    specific_variance = np.clip(
+        np.diag(covariance) - np.sum(loadings**2, axis=1), 0, None
+    )
+    return loadings, specific_variance
+
+
+# Registry of available covariance estimators
+COVARIANCE_ESTIMATORS = {
+    "sample": sample_covariance,
+    "ledoit_wolf": ledoit_wolf_covariance,
+}
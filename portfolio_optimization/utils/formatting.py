@@ -27,12 +27,14 @@ def print_key_value(key: str, value, indent: int = 2) -> None:
     print(f"{' ' * indent}{key}: {value}")
 
 
+def _row_format(widths: list) -> str:
+    """Build a str.format template for right-aligned columns of given widths."""
+    return "  " + "".join(f"{{:>{width}}}  " for width in widths)
+
+
 def print_table_row(columns: list, widths: list) -> None:
     """Print a formatted table row."""
-    row = ""
-    for col, width in zip(columns, widths):
-        row += f"{str(col):>{width}}  "
-    print(f"  {row}")
+    print(_row_format(widths).format(*map(str, columns)))
 
 
 def print_results(result: "OptimizationResult") -> None:
@@ -47,18 +49,20 @@ def print_results(result: "OptimizationResult") -> None:
     tickers = result.tickers
     ticker_width = max(len(t) for t in tickers)
     col_widths = [8] + [ticker_width + 2] * len(tickers) + [10]
+    row_format = _row_format(col_widths)
 
     # Table header
     header = ["Return"] + tickers + ["Volatility"]
-    print_table_row(header, col_widths)
+    print(row_format.format(*header))
     print(f"  {'-' * sum(w + 2 for w in col_widths)}")
 
     # Table rows
-    for i in range(len(result.expected_returns)):
-        weights_pct = [f"{w * 100:.1f}%" for w in result.weights[i]]
-        row = (
-            [f"{result.expected_returns[i] * 100:.2f}%"]
-            + weights_pct
-            + [f"{result.volatilities[i] * 100:.2f}%"]
+    for expected_return, weights, volatility in zip(
+        result.expected_returns, result.weights, result.volatilities
+    ):
+        cells = (
+            [f"{expected_return * 100:.2f}%"]
+            + [f"{w * 100:.1f}%" for w in weights]
+            + [f"{volatility * 100:.2f}%"]
         )
-        print_table_row(row, col_widths)
+        print(row_format.format(*cells))
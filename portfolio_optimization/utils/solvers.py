@@ -1,9 +1,53 @@
 """Common optimization solvers used across algorithms."""
 
 import numpy as np
+import scipy.linalg as linalg
 import scipy.optimize as optimize
 
 
+def _portfolio_variance(weights: np.ndarray, covariance_matrix: np.ndarray) -> float:
+    """Portfolio variance w' Sigma w (objective kernel shared by the solvers)."""
+    return float(weights @ (covariance_matrix @ weights))
+
+
+def _portfolio_variance_grad(
+    weights: np.ndarray, covariance_matrix: np.ndarray
+) -> np.ndarray:
+    """Gradient of the portfolio variance, 2 Sigma w."""
+    return 2 * (covariance_matrix @ weights)
+
+
+def _negative_sharpe_ratio(
+    weights: np.ndarray,
+    expected_returns: np.ndarray,
+    covariance_matrix: np.ndarray,
+    risk_free_rate: float,
+) -> float:
+    """Negative Sharpe ratio (for minimization)."""
+    portfolio_volatility = np.sqrt(_portfolio_variance(weights, covariance_matrix))
+    if portfolio_volatility == 0:
+        return 0.0
+    return -(float(weights @ expected_returns) - risk_free_rate) / portfolio_volatility
+
+
+def _negative_sharpe_ratio_grad(
+    weights: np.ndarray,
+    expected_returns: np.ndarray,
+    covariance_matrix: np.ndarray,
+    risk_free_rate: float,
+) -> np.ndarray:
+    """Gradient of the negative Sharpe ratio."""
+    covariance_weights = covariance_matrix @ weights
+    portfolio_volatility = np.sqrt(float(weights @ covariance_weights))
+    if portfolio_volatility == 0:
+        return np.zeros_like(weights)
+    excess_return = float(weights @ expected_returns) - risk_free_rate
+    return -(
+        expected_returns * portfolio_volatility
+        - excess_return * covariance_weights / portfolio_volatility
+    ) / portfolio_volatility**2
+
+
 def minimize_variance_portfolio(
     expected_returns: np.ndarray,
     target_return: float,
@@ -27,20 +71,20 @@ def minimize_variance_portfolio(
         Optimal portfolio weights as numpy array
     """
     num_assets = len(expected_returns)
-
-    def objective(weights: np.ndarray) -> float:
-        """Minimize portfolio variance."""
-        return float(weights.T @ covariance_matrix @ weights)
+    ones = np.ones(num_assets)
 
     constraints = []
     if with_return_constraint:
         constraints.append(
             {
                 "type": "eq",
-                "fun": lambda w: np.sum(w * expected_returns) - target_return,
+                "fun": lambda w: w @ expected_returns - target_return,
+                "jac": lambda w: expected_returns,
             }
         )
-    constraints.append({"type": "eq", "fun": lambda w: np.sum(w) - 1})
+    constraints.append(
+        {"type": "eq", "fun": lambda w: np.sum(w) - 1, "jac": lambda w: ones}
+    )
 
     # Set bounds based on short selling allowance
     if allow_short:
@@ -52,8 +96,10 @@ def minimize_variance_portfolio(
     initial_weights = np.ones(num_assets) / num_assets
 
     result = optimize.minimize(
-        objective,
+        _portfolio_variance,
         initial_weights,
+        args=(covariance_matrix,),
+        jac=_portfolio_variance_grad,
         method="SLSQP",
         bounds=bounds,
         constraints=constraints,
@@ -62,6 +108,148 @@ def minimize_variance_portfolio(
     return result.x
 
 
+def efficient_frontier_portfolios(
+    expected_returns: np.ndarray,
+    target_returns: np.ndarray,
+    covariance_matrix: np.ndarray,
+    allow_short: bool = False,
+    covariance_cho: tuple[np.ndarray, bool] | None = None,
+    closed_form: bool = True,
+) -> np.ndarray:
+    """
+    Find the minimum variance portfolio for each of several target returns.
+
+    Without bounds, the optimal weights are affine in the target return,
+    w(t) = a + t * b, where a and b come from Sigma^-1 1 and Sigma^-1 mu. One
+    Cholesky factorization therefore gives the whole unbounded frontier.
+    Points whose closed-form weights already satisfy the weight bounds are
+    optimal for the bounded problem too. The remaining points (or all of
+    them, if the covariance matrix is singular) are solved with
+    minimize_variance_portfolio.
+
+    Args:
+        expected_returns: Expected returns for each asset
+        target_returns: Target portfolio returns, shape (num_portfolios,)
+        covariance_matrix: Covariance matrix of asset returns
+        allow_short: If True, allow short selling (negative weights)
+        covariance_cho: Precomputed scipy.linalg.cho_factor of the covariance
+            matrix; factored here when omitted
+        closed_form: If False, skip the closed form and solve every point with
+            SLSQP (e.g. when the covariance matrix is known to be singular)
+
+    Returns:
+        Optimal portfolio weights, shape (num_portfolios, num_assets)
+    """
+    return efficient_frontier_portfolios_batch(
+        expected_returns[np.newaxis, :],
+        target_returns,
+        covariance_matrix,
+        allow_short=allow_short,
+        covariance_cho=covariance_cho,
+        closed_form=closed_form,
+    )[0]
+
+
+def efficient_frontier_portfolios_batch(
+    expected_returns: np.ndarray,
+    target_returns: np.ndarray,
+    covariance_matrix: np.ndarray,
+    allow_short: bool = False,
+    covariance_cho: tuple[np.ndarray, bool] | None = None,
+    closed_form: bool = True,
+) -> np.ndarray:
+    """
+    Efficient frontiers for several expected-return vectors sharing one Sigma.
+
+    Vectorized form of efficient_frontier_portfolios: the covariance matrix is
+    factored once and the closed-form frontiers of all samples come from a
+    single multi-RHS triangular solve.
+
+    Args:
+        expected_returns: Expected returns, shape (num_samples, num_assets)
+        target_returns: Target portfolio returns, shape (num_portfolios,)
+        covariance_matrix: Covariance matrix of asset returns
+        allow_short: If True, allow short selling (negative weights)
+        covariance_cho: Precomputed scipy.linalg.cho_factor of the covariance
+            matrix; factored here when omitted
+        closed_form: If False, skip the closed form and solve every point with
+            SLSQP (e.g. when the covariance matrix is known to be singular)
+
+    Returns:
+        Optimal portfolio weights, shape (num_samples, num_portfolios, num_assets)
+    """
+    num_samples, num_assets = expected_returns.shape
+    lower_bound = -1.0 if allow_short else 0.0
+    weights = (
+        _closed_form_frontier(
+            expected_returns, target_returns, covariance_matrix, covariance_cho
+        )
+        if closed_form
+        else None
+    )
+
+    if weights is None:
+        feasible = np.zeros((num_samples, len(target_returns)), dtype=bool)
+        weights = np.zeros((num_samples, len(target_returns), num_assets))
+    else:
+        tolerance = 1e-10
+        feasible = np.all(
+            (weights >= lower_bound - tolerance) & (weights <= 1 + tolerance), axis=2
+        )
+        np.clip(weights, lower_bound, 1.0, out=weights)
+
+    for i, k in zip(*np.nonzero(~feasible)):
+        weights[i, k] = minimize_variance_portfolio(
+            expected_returns[i],
+            target_returns[k],
+            covariance_matrix,
+            allow_short=allow_short,
+        )
+
+    return weights
+
+
+def _closed_form_frontier(
+    expected_returns: np.ndarray,
+    target_returns: np.ndarray,
+    covariance_matrix: np.ndarray,
+    cov_cho: tuple[np.ndarray, bool] | None = None,
+) -> np.ndarray | None:
+    """
+    Unbounded minimum variance weights for each sample and target return.
+
+    Returns None if the covariance matrix is not positive definite. Samples
+    whose expected returns are all equal get NaN weights.
+    """
+    if cov_cho is None:
+        try:
+            cov_cho = linalg.cho_factor(covariance_matrix)
+        except linalg.LinAlgError:
+            return None
+
+    # One triangular solve for Sigma^-1 [1, mu_1, ..., mu_S]; the factor
+    # already passed cho_factor's finiteness check, so skip re-validating
+    rhs = np.column_stack([np.ones(covariance_matrix.shape[0]), expected_returns.T])
+    solved = linalg.cho_solve(cov_cho, rhs, check_finite=False)
+    inv_ones, inv_returns = solved[:, 0], solved[:, 1:].T
+
+    a = np.sum(inv_ones)
+    b = np.sum(inv_returns, axis=1)
+    c = np.einsum("si,si->s", expected_returns, inv_returns)
+    determinant = a * c - b * b
+    determinant[determinant <= 1e-12 * a * c] = np.nan
+
+    determinant = determinant[:, np.newaxis]
+    intercept = (np.outer(c, inv_ones) - b[:, np.newaxis] * inv_returns) / determinant
+    slope = (a * inv_returns - np.outer(b, inv_ones)) / determinant
+
+    # Shape: (num_samples, num_portfolios, num_assets)
+    return (
+        intercept[:, np.newaxis, :]
+        + target_returns[np.newaxis, :, np.newaxis] * slope[:, np.newaxis, :]
+    )
+
+
 def maximize_sharpe_portfolio(
     expected_returns: np.ndarray,
     covariance_matrix: np.ndarray,
@@ -71,6 +259,12 @@ def maximize_sharpe_portfolio(
     """
     Find the maximum Sharpe ratio portfolio.
 
+    For long-only portfolios the fractional Sharpe objective is rewritten as a
+    convex quadratic program (Schaible transform): with y = w / (w'(mu - rf)),
+    minimize y' Sigma y subject to (mu - rf)' y = 1 and y >= 0, then recover
+    w = y / sum(y). The direct SLSQP search on the Sharpe ratio is kept as a
+    fallback when no asset beats the risk-free rate or short selling is allowed.
+
     Args:
         expected_returns: Expected returns for each asset
         covariance_matrix: Covariance matrix of asset returns
@@ -81,16 +275,17 @@ def maximize_sharpe_portfolio(
         Optimal portfolio weights
     """
     num_assets = len(expected_returns)
+    excess_returns = expected_returns - risk_free_rate
 
-    def negative_sharpe(weights: np.ndarray) -> float:
-        """Negative Sharpe ratio (for minimization)."""
-        portfolio_return = np.sum(weights * expected_returns)
-        portfolio_volatility = np.sqrt(weights.T @ covariance_matrix @ weights)
-        if portfolio_volatility == 0:
-            return 0
-        return -(portfolio_return - risk_free_rate) / portfolio_volatility
+    if not allow_short and np.any(excess_returns > 0):
+        scaled_weights = _solve_sharpe_qp(excess_returns, covariance_matrix)
+        if scaled_weights is not None:
+            return scaled_weights / np.sum(scaled_weights)
 
-    constraints = [{"type": "eq", "fun": lambda w: np.sum(w) - 1}]
+    ones = np.ones(num_assets)
+    constraints = [
+        {"type": "eq", "fun": lambda w: np.sum(w) - 1, "jac": lambda w: ones}
+    ]
 
     if allow_short:
         bounds = tuple((-1, 1) for _ in range(num_assets))
@@ -100,8 +295,10 @@ def maximize_sharpe_portfolio(
     initial_weights = np.ones(num_assets) / num_assets
 
     result = optimize.minimize(
-        negative_sharpe,
+        _negative_sharpe_ratio,
         initial_weights,
+        args=(expected_returns, covariance_matrix, risk_free_rate),
+        jac=_negative_sharpe_ratio_grad,
         method="SLSQP",
         bounds=bounds,
         constraints=constraints,
@@ -110,6 +307,48 @@ def maximize_sharpe_portfolio(
     return result.x
 
 
+def _solve_sharpe_qp(
+    excess_returns: np.ndarray,
+    covariance_matrix: np.ndarray,
+) -> np.ndarray | None:
+    """
+    Solve the convex reformulation of the long-only max-Sharpe problem.
+
+    Returns the scaled weights y, or None if the solver did not converge.
+    """
+    num_assets = len(excess_returns)
+
+    # Feasible start: equal weights if they beat rf, else the best single asset
+    initial_weights = np.ones(num_assets) / num_assets
+    initial_excess = float(initial_weights @ excess_returns)
+    if initial_excess <= 0:
+        initial_weights = np.zeros(num_assets)
+        initial_weights[np.argmax(excess_returns)] = 1.0
+        initial_excess = float(initial_weights @ excess_returns)
+
+    constraints = [
+        {
+            "type": "eq",
+            "fun": lambda y: y @ excess_returns - 1,
+            "jac": lambda y: excess_returns,
+        }
+    ]
+
+    result = optimize.minimize(
+        _portfolio_variance,
+        initial_weights / initial_excess,
+        args=(covariance_matrix,),
+        jac=_portfolio_variance_grad,
+        method="SLSQP",
+        bounds=tuple((0, None) for _ in range(num_assets)),
+        constraints=constraints,
+    )
+
+    if not result.success or np.sum(result.x) <= 0:
+        return None
+    return result.x
+
+
 def minimize_volatility_portfolio(
     covariance_matrix: np.ndarray,
     allow_short: bool = False,
@@ -126,10 +365,10 @@ def minimize_volatility_portfolio(
     """
     num_assets = covariance_matrix.shape[0]
 
-    def objective(weights: np.ndarray) -> float:
-        return float(weights.T @ covariance_matrix @ weights)
-
-    constraints = [{"type": "eq", "fun": lambda w: np.sum(w) - 1}]
+    ones = np.ones(num_assets)
+    constraints = [
+        {"type": "eq", "fun": lambda w: np.sum(w) - 1, "jac": lambda w: ones}
+    ]
 
     if allow_short:
         bounds = tuple((-1, 1) for _ in range(num_assets))
@@ -139,8 +378,10 @@ def minimize_volatility_portfolio(
     initial_weights = np.ones(num_assets) / num_assets
 
     result = optimize.minimize(
-        objective,
+        _portfolio_variance,
         initial_weights,
+        args=(covariance_matrix,),
+        jac=_portfolio_variance_grad,
         method="SLSQP",
         bounds=bounds,
         constraints=constraints,